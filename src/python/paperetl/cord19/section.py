@@ -6,8 +6,6 @@ import json
 import os
 import re
 
-from nltk.tokenize import sent_tokenize
-
 from ..table import Table
 from ..text import Text
 
@@ -43,7 +41,7 @@ class Section:
                 # Transform and clean text
                 text = Text.transform(text)
 
-                sections.extend([(name.upper(), x) for x in sent_tokenize(text)])
+                sections.extend([(name.upper(), x) for x in Text.sentences(text)])
 
         # Process each JSON file
         for path in Section.files(row):
@@ -68,7 +66,7 @@ class Section:
                         text = Text.transform(text)
 
                         # Split text into sentences, transform text and add to sections
-                        sections.extend([(name, x) for x in sent_tokenize(text)])
+                        sections.extend([(name, x) for x in Text.sentences(text)])
 
                     # Extract text from tables
                     for name, entry in data["ref_entries"].items():
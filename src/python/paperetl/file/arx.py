@@ -2,16 +2,19 @@
 arXiv XML processing module
 """
 
+import datetime
 import hashlib
 import re
 
-from bs4 import BeautifulSoup
 from dateutil import parser
-from nltk.tokenize import sent_tokenize
+from lxml import etree
 
 from ..schema.article import Article
 from ..text import Text
 
+# Compiled pattern for collapsing whitespace
+SPACES = re.compile(r"\s+")
+
 
 class ARX:
     """
@@ -26,54 +29,70 @@ class ARX:
         Args:
             stream: handle to input data stream
             source: text string describing stream source, can be None
-            config: path to config directory
         """
 
-        # Parse XML
-        soup = BeautifulSoup(stream, "lxml")
+        # Parse XML content using lxml, streaming one entry at a time
+        # pylint: disable=c-extension-no-member
+        for _, element in etree.iterparse(stream, events=("end",), tag="{*}entry"):
+            yield ARX.process(element, source)
 
-        # Process each entry
-        for entry in soup.find_all("entry"):
-            reference = ARX.get(entry, "id")
-            title = ARX.get(entry, "title")
-            published = parser.parse(ARX.get(entry, "published").split("T")[0])
-            updated = parser.parse(ARX.get(entry, "updated").split("T")[0])
+            # Release processed elements
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
 
-            # Derive uid
-            uid = hashlib.sha1(reference.encode("utf-8")).hexdigest()
+    @staticmethod
+    def process(entry, source):
+        """
+        Processes a single XML entry element into an Article.
+
+        Args:
+            entry: XML element
+            source: text string describing stream source, can be None
 
-            # Get journal reference
-            journal = ARX.get(entry, "arxiv:journal_ref")
+        Returns:
+            Article
+        """
 
-            # Get authors
-            authors, affiliations, affiliation = ARX.authors(entry.find_all("author"))
+        reference = ARX.get(entry, "{*}id")
+        title = ARX.get(entry, "{*}title")
+        published = ARX.date(ARX.get(entry, "{*}published"))
+        updated = ARX.date(ARX.get(entry, "{*}updated"))
 
-            # Get tags
-            tags = "; ".join(
-                ["ARX"]
-                + [category.get("term") for category in entry.find_all("category")]
-            )
+        # Derive uid
+        uid = hashlib.sha1(reference.encode("utf-8")).hexdigest()
 
-            # Transform section text
-            sections = ARX.sections(title, ARX.get(entry, "summary"))
-
-            # Article metadata - id, source, published, publication, authors, affiliations, affiliation, title,
-            #                    tags, reference, entry date
-            metadata = (
-                uid,
-                source,
-                published,
-                journal,
-                authors,
-                affiliations,
-                affiliation,
-                title,
-                tags,
-                reference,
-                updated,
-            )
+        # Get journal reference
+        journal = ARX.get(entry, "{*}journal_ref")
 
-            yield Article(metadata, sections)
+        # Get authors
+        authors, affiliations, affiliation = ARX.authors(entry.iterfind("{*}author"))
+
+        # Get tags
+        tags = "; ".join(
+            ["ARX", *(category.get("term") for category in entry.iter("{*}category"))]
+        )
+
+        # Transform section text
+        sections = ARX.sections(title, ARX.get(entry, "{*}summary"))
+
+        # Article metadata - id, source, published, publication, authors, affiliations, affiliation, title,
+        #                    tags, reference, entry date
+        metadata = (
+            uid,
+            source,
+            published,
+            journal,
+            authors,
+            affiliations,
+            affiliation,
+            title,
+            tags,
+            reference,
+            updated,
+        )
+
+        return Article(metadata, sections)
 
     @staticmethod
     def get(element, path):
@@ -89,7 +108,41 @@ class ARX:
         """
 
         element = element.find(path)
-        return ARX.clean(element.text) if element else None
+        return ARX.clean(ARX.text(element)) if element is not None else None
+
+    @staticmethod
+    def text(element):
+        """
+        Flattens elements into a single text string.
+
+        Args:
+            element: XML element
+
+        Returns:
+            string
+        """
+
+        return "".join(element.itertext())
+
+    @staticmethod
+    def date(timestamp):
+        """
+        Parses the date portion of a timestamp.
+
+        Args:
+            timestamp: ISO 8601 timestamp string
+
+        Returns:
+            datetime
+        """
+
+        date = timestamp.split("T")[0]
+
+        # Fast path for YYYY-MM-DD dates, fallback to dateutil for other formats
+        try:
+            return datetime.datetime.fromisoformat(date)
+        except ValueError:
+            return parser.parse(date)
 
     @staticmethod
     def clean(text):
@@ -103,9 +156,12 @@ class ARX:
             clean text
         """
 
-        # Remove newlines and cleanup spacing
-        text = text.replace("\n", " ")
-        return re.sub(r"\s+", " ", text).strip()
+        # Skip empty text
+        if not text:
+            return text
+
+        # Remove newlines and cleanup spacing in a single pass
+        return SPACES.sub(" ", text).strip()
 
     @staticmethod
     def authors(elements):
@@ -124,15 +180,13 @@ class ARX:
 
         for author in elements:
             # Create authors as lastname, firstname
-            name = ARX.get(author, "name")
+            name = ARX.get(author, "{*}name")
             authors.append(", ".join(name.rsplit(maxsplit=1)[::-1]))
 
             # Add affiliations
             affiliations.extend(
-                [
-                    ARX.clean(affiliation.text)
-                    for affiliation in author.find_all("arxiv:affiliation")
-                ]
+                ARX.clean(ARX.text(affiliation))
+                for affiliation in author.iterfind("{*}affiliation")
             )
 
         return (
@@ -161,6 +215,6 @@ class ARX:
         text = Text.transform(text)
 
         # Split text into sentences, transform text and add to sections
-        sections.extend([("ABSTRACT", x) for x in sent_tokenize(text)])
+        sections.extend([("ABSTRACT", x) for x in Text.sentences(text)])
 
         return sections
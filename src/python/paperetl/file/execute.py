@@ -39,7 +39,12 @@ class Execute:
 
         return (
             "rb"
-            if extension == "pdf" or (source and source.lower().startswith("pubmed"))
+            if extension == "pdf"
+            or (
+                extension == "xml"
+                and source
+                and source.lower().startswith(("arxiv", "pubmed"))
+            )
             else "r"
         )
 
@@ -2,12 +2,12 @@
 PubMed archive XML processing module
 """
 
+import datetime
 import os
 import re
 
 from dateutil import parser
 from lxml import etree
-from nltk.tokenize import sent_tokenize
 
 from ..schema.article import Article
 from ..text import Text
@@ -18,6 +18,22 @@ class PMB:
     Methods to transform PubMed archive XML files into article objects.
     """
 
+    # Month abbreviations used in PubMed dates
+    MONTHS = {
+        "Jan": 1,
+        "Feb": 2,
+        "Mar": 3,
+        "Apr": 4,
+        "May": 5,
+        "Jun": 6,
+        "Jul": 7,
+        "Aug": 8,
+        "Sep": 9,
+        "Oct": 10,
+        "Nov": 11,
+        "Dec": 12,
+    }
+
     @staticmethod
     def load(config, name):
         """
@@ -181,12 +197,20 @@ class PMB:
             Date if parsed
         """
 
-        date = ""
-        for field in ["Year", "Month", "Day"]:
-            value = PMB.get(element, field)
-            if value:
-                date += "-" + value if date else value
+        values = [PMB.get(element, field) for field in ["Year", "Month", "Day"]]
+
+        # Fast path for fully specified dates with 4 digit years and numeric or abbreviated months
+        year, month, day = values
+        if year and month and day:
+            month = month if month.isdigit() else PMB.MONTHS.get(month)
+            if month and len(year) == 4 and year.isdigit() and day.isdigit():
+                try:
+                    return datetime.datetime(int(year), int(month), int(day))
+                except ValueError:
+                    pass
 
+        # Fallback to dateutil for partial and free-form dates
+        date = "-".join(value for value in values if value)
         return parser.parse(date) if date else None
 
     @staticmethod
@@ -316,7 +340,7 @@ class PMB:
         text = Text.transform(PMB.text(element))
 
         # No embedded sections
-        return [("ABSTRACT", x) for x in sent_tokenize(text)]
+        return [("ABSTRACT", x) for x in Text.sentences(text)]
 
     @staticmethod
     def formatted(element):
@@ -365,7 +389,7 @@ class PMB:
                 # Save previous section
                 if texts:
                     sections.extend(
-                        [(name, t) for t in sent_tokenize("".join(texts).strip())]
+                        [(name, t) for t in Text.sentences("".join(texts).strip())]
                     )
 
                 # Reset section name/texts
@@ -381,7 +405,7 @@ class PMB:
 
         # Save last section
         if texts:
-            sections.extend([(name, t) for t in sent_tokenize("".join(texts).strip())])
+            sections.extend([(name, t) for t in Text.sentences("".join(texts).strip())])
 
         return sections
 
@@ -413,7 +437,7 @@ class PMB:
                 text = Text.transform(PMB.text(element))
 
                 # Split text into sentences, transform text and add to sections
-                sections.extend([(name, x) for x in sent_tokenize(text)])
+                sections.extend([(name, x) for x in Text.sentences(text)])
 
         return sections
 
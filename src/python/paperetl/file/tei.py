@@ -7,7 +7,6 @@ import hashlib
 
 from bs4 import BeautifulSoup
 from dateutil import parser
-from nltk.tokenize import sent_tokenize
 
 from ..schema.article import Article
 from ..table import Table
@@ -199,7 +198,7 @@ class TEI:
             abstract = Text.transform(abstract)
             abstract = abstract.replace("\n", " ")
 
-            sections.extend([("ABSTRACT", x) for x in sent_tokenize(abstract)])
+            sections.extend([("ABSTRACT", x) for x in Text.sentences(abstract)])
 
         return sections
 
@@ -239,7 +238,7 @@ class TEI:
             text = Text.transform(text)
 
             # Split text into sentences, transform text and add to sections
-            sections.extend([(name, x) for x in sent_tokenize(text)])
+            sections.extend([(name, x) for x in Text.sentences(text)])
 
         # Extract text from tables
         for figure in soup.find("text").find_all("figure"):
@@ -26,6 +26,9 @@ class Article:
     # Sections schema
     SECTION = ("name", "text")
 
+    # Fixed instance attributes
+    __slots__ = ("metadata", "sections")
+
     def __init__(self, metadata, sections):
         """
         Stores article metadata and section content as an object.
@@ -90,7 +93,7 @@ class Article:
         article = dict(zip(Article.ARTICLE, self.metadata))
 
         # Create sections
-        sections = [dict(zip(Article.SECTION, section)) for section in self.sections]
+        sections = [{"name": name, "text": text} for name, text in self.sections]
 
         # Add sections to article
         article["sections"] = sections
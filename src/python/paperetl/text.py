@@ -4,10 +4,18 @@ Text module
 
 import re
 
+import nltk
+
 # Compiled pattern for cleaning text
 # pylint: disable=W0603
 PATTERN = None
 
+# Compiled pattern for removing extra spacing
+SPACING = re.compile(r" {2,}|\.{2,}")
+
+# Sentence tokenizer
+TOKENIZER = None
+
 
 def getPattern():
     """
@@ -46,6 +54,29 @@ def getPattern():
     return PATTERN
 
 
+def getTokenizer():
+    """
+    Gets or loads the English Punkt sentence tokenizer.
+
+    Returns:
+        sentence tokenizer
+    """
+
+    global TOKENIZER
+
+    if not TOKENIZER:
+        try:
+            # NLTK >= 3.8.2 distributes Punkt models as parameter tables
+            # pylint: disable=C0415
+            from nltk.tokenize import PunktTokenizer
+
+            TOKENIZER = PunktTokenizer()
+        except ImportError:
+            TOKENIZER = nltk.data.load("tokenizers/punkt/english.pickle")
+
+    return TOKENIZER
+
+
 class Text:
     """
     Methods for formatting and cleaning text.
@@ -67,6 +98,20 @@ class Text:
         text = getPattern().sub(" ", text)
 
         # Remove extra spacing either caused by replacements or already in text
-        text = re.sub(r" {2,}|\.{2,}", " ", text)
+        text = SPACING.sub(" ", text)
 
         return text
+
+    @staticmethod
+    def sentences(text):
+        """
+        Splits text into sentences.
+
+        Args:
+            text: input text
+
+        Returns:
+            list of sentences
+        """
+
+        return getTokenizer().tokenize(text)
@@ -0,0 +1,92 @@
+"""
+arXiv XML tests
+"""
+
+import datetime
+import io
+import unittest
+
+from paperetl.file.arx import ARX
+from paperetl.file.execute import Execute
+
+# Sample arXiv API feed
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title type="html">ArXiv Query</title>
+  <id>http://arxiv.org/api/query</id>
+  <updated>2020-01-03T00:00:00-05:00</updated>
+  <entry>
+    <id>http://arxiv.org/abs/2001.00001v1</id>
+    <updated>2020-01-02T10:00:00Z</updated>
+    <published>2020-01-01T10:00:00Z</published>
+    <title>A Test
+      Article</title>
+    <summary>  This is the first sentence. This is the
+      second sentence.</summary>
+    <author>
+      <name>Jane Q Doe</name>
+      <arxiv:affiliation>University A</arxiv:affiliation>
+    </author>
+    <author>
+      <name>John Smith</name>
+      <arxiv:affiliation>University B</arxiv:affiliation>
+    </author>
+    <arxiv:journal_ref>J. Test 1 (2020)</arxiv:journal_ref>
+    <arxiv:primary_category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+
+class TestARX(unittest.TestCase):
+    """
+    arXiv XML tests
+    """
+
+    def testDate(self):
+        """
+        Test parsing ISO 8601 and fallback date formats
+        """
+
+        self.assertEqual(
+            ARX.date("2020-01-01T10:00:00Z"), datetime.datetime(2020, 1, 1)
+        )
+        self.assertEqual(ARX.date("Jan 5, 2020"), datetime.datetime(2020, 1, 5))
+
+    def testMode(self):
+        """
+        Test arXiv XML files are opened in binary mode and other formats in text mode
+        """
+
+        self.assertEqual(Execute.mode("arxiv.xml", "xml"), "rb")
+        self.assertEqual(Execute.mode("arxiv.csv", "csv"), "r")
+
+    def testParse(self):
+        """
+        Test parsing an arXiv feed
+        """
+
+        articles = list(ARX.parse(io.BytesIO(FEED), "arxiv.xml"))
+        self.assertEqual(len(articles), 1)
+
+        article = articles[0].build()
+        self.assertEqual(article["source"], "arxiv.xml")
+        self.assertEqual(article["published"], datetime.datetime(2020, 1, 1))
+        self.assertEqual(article["publication"], "J. Test 1 (2020)")
+        self.assertEqual(article["authors"], "Doe, Jane Q; Smith, John")
+        self.assertEqual(article["affiliations"], "University A; University B")
+        self.assertEqual(article["affiliation"], "University B")
+        self.assertEqual(article["title"], "A Test Article")
+        self.assertEqual(article["tags"], "ARX; cs.CL; cs.LG")
+        self.assertEqual(article["reference"], "http://arxiv.org/abs/2001.00001v1")
+        self.assertEqual(article["entry"], datetime.datetime(2020, 1, 2))
+        self.assertEqual(
+            article["sections"],
+            [
+                {"name": "TITLE", "text": "A Test Article"},
+                {"name": "ABSTRACT", "text": "This is the first sentence."},
+                {"name": "ABSTRACT", "text": "This is the second sentence."},
+            ],
+        )
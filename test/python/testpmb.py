@@ -0,0 +1,63 @@
+"""
+PubMed XML tests
+"""
+
+import unittest
+
+from dateutil import parser
+from lxml import etree
+
+from paperetl.file.pmb import PMB
+
+
+class TestPMB(unittest.TestCase):
+    """
+    PubMed XML tests
+    """
+
+    def testDate(self):
+        """
+        Test date parsing matches dateutil
+        """
+
+        dates = [
+            ("2019", "03", "07"),
+            ("2019", "3", "7"),
+            ("2019", "Jan", "05"),
+            ("2019", "Dec", "31"),
+            ("99", "Jan", "05"),
+            ("19", "03", "07"),
+            ("2019", "13", "05"),
+            ("2019", "Feb", "30"),
+            ("2019", "Sep", None),
+            ("2019", "03", None),
+            ("2019", None, None),
+            (" 2019 ", " Jan ", " 05 "),
+            ("2019 ", "03", " 7"),
+        ]
+
+        for date in dates:
+            with self.subTest(date=date):
+                # pylint: disable=c-extension-no-member
+                element = etree.Element("PubDate")
+                for field, value in zip(["Year", "Month", "Day"], date):
+                    if value:
+                        etree.SubElement(element, field).text = value
+
+                # Invalid dates must fail the same way as dateutil
+                text = "-".join(value for value in date if value)
+                try:
+                    expected = parser.parse(text)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        PMB.date(element)
+                else:
+                    self.assertEqual(PMB.date(element), expected)
+
+    def testDateEmpty(self):
+        """
+        Test date parsing without date fields
+        """
+
+        # pylint: disable=c-extension-no-member
+        self.assertIsNone(PMB.date(etree.Element("PubDate")))